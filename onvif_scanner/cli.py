@@ -1,11 +1,12 @@
 import argparse
 import logging
+import os
 import sys
 from rich.console import Console
 from rich.logging import RichHandler
 from .scanner import WSDiscoveryScanner, IPRangeScanner
 from .inspector import CameraInspector
-from .output import print_summary_table, export_to_json
+from .output import print_summary_table, print_aggregate_summary, EXPORTERS
 from .utils import get_network_interfaces
 from .models import CameraInfo
 
@@ -16,16 +17,30 @@ def main():
     parser.add_argument("--subnet", help="CIDR subnet for IP range scanning (e.g., 192.168.1.0/24)")
     parser.add_argument("--user", required=False, help="Camera username")
     parser.add_argument("--password", required=False, help="Camera password")
-    parser.add_argument("--output", required=False, help="Output JSON file")
+    parser.add_argument("--output", required=False, help="Output file")
+    parser.add_argument("--format", choices=sorted(EXPORTERS), default=None, help="Output file format (default: inferred from --output extension, else json)")
+    display_group = parser.add_mutually_exclusive_group()
+    display_group.add_argument("--page-size", type=int, default=0, help="Print the results table in pages of N rows (0 = single table)")
+    display_group.add_argument("--summary", action="store_true", help="Print counts grouped by subnet, manufacturer and model instead of one row per camera")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
 
+    if args.page_size < 0:
+        parser.error("--page-size must be 0 or greater")
+
     # Setup logging
     level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(level=level, format="%(message)s", datefmt="[%X]", handlers=[RichHandler()])
     logger = logging.getLogger("onvif_scanner")
 
+    # Resolve the output format from --format or the --output extension
+    output_ext = os.path.splitext(args.output)[1].lstrip('.').lower() if args.output else ""
+    if not args.format:
+        args.format = output_ext if output_ext in EXPORTERS else "json"
+    elif output_ext and output_ext != args.format:
+        logger.warning(f"Writing {args.format} output to {args.output}, whose extension suggests {output_ext}.")
+
     console = Console()
 
     found_ips = []
@@ -133,13 +148,19 @@ def main():
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         if subnets and len(subnets) == 1:
             subnet_str = subnets[0].replace('/', '_')
-            args.output = f"scan_{subnet_str}_{timestamp}.json"
+            args.output = f"scan_{subnet_str}_{timestamp}.{args.format}"
         else:
-            args.output = f"scan_network_{timestamp}.json"
+            args.output = f"scan_network_{timestamp}.{args.format}"
 
-    print_summary_table(results)
-    export_to_json(results, args.output)
-    console.print(f"[bold blue]Results saved to {args.output}[/bold blue]")
+    if args.summary:
+        print_aggregate_summary(results, subnets)
+    else:
+        print_summary_table(results, page_size=args.page_size)
+    if EXPORTERS[args.format](results, args.output):
+        console.print(f"[bold blue]Results saved to {args.output}[/bold blue]")
+    else:
+        console.print(f"[bold red]Failed to save results to {args.output}[/bold red]")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
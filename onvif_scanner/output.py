@@ -1,6 +1,10 @@
+import csv
+import ipaddress
 import json
 import logging
-from typing import List
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 from rich.console import Console
 from rich.table import Table
 from .models import CameraInfo
@@ -8,9 +12,55 @@ from dataclasses import asdict
 
 logger = logging.getLogger(__name__)
 
-def print_summary_table(cameras: List[CameraInfo]):
-    console = Console()
-    table = Table(title="ONVIF Camera Scan Results")
+CSV_FIELDS = [
+    "ip",
+    "manufacturer",
+    "model",
+    "firmware",
+    "serial",
+    "ptz",
+    "streams",
+    "rtsp_uris",
+    "inspection_status",
+]
+
+def _ptz_supported(cam: CameraInfo) -> bool:
+    return bool(cam.ptz and cam.ptz.supported)
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Prefix used to group cameras that fall outside every scanned subnet
+DEFAULT_PREFIX = {4: 24, 6: 64}
+
+def _parse_networks(subnets: Optional[Iterable[str]]) -> List[Network]:
+    networks = []
+    for subnet in subnets or []:
+        try:
+            networks.append(ipaddress.ip_network(subnet, strict=False))
+        except ValueError:
+            logger.debug(f"Ignoring invalid subnet {subnet!r} for grouping")
+    # Most specific network first, so overlapping scans group tightly
+    return sorted(networks, key=lambda n: n.prefixlen, reverse=True)
+
+def _subnet_of(ip: str, networks: List[Network]) -> str:
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return "unknown"
+    for network in networks:
+        if address.version == network.version and address in network:
+            return str(network)
+    prefix = DEFAULT_PREFIX[address.version]
+    return str(ipaddress.ip_interface(f"{address}/{prefix}").network)
+
+def _subnet_sort_key(subnet: str):
+    if subnet == "unknown":
+        return (1,)
+    network = ipaddress.ip_network(subnet)
+    return (0, network.version, network)
+
+def _new_table(title: str) -> Table:
+    table = Table(title=title)
 
     table.add_column("IP Address", style="cyan", no_wrap=True)
     table.add_column("Manufacturer", style="magenta")
@@ -18,25 +68,161 @@ def print_summary_table(cameras: List[CameraInfo]):
     table.add_column("PTZ", style="yellow")
     table.add_column("RTSP Streams", justify="right")
 
+    return table
+
+def _pages(cameras: Iterable[CameraInfo], page_size: Optional[int]) -> Iterator[List[CameraInfo]]:
+    it = iter(cameras)
+    while True:
+        page = list(islice(it, page_size))
+        if not page:
+            return
+        yield page
+
+def print_summary_table(cameras: Iterable[CameraInfo], page_size: Optional[int] = None):
+    """
+    Prints the per-camera results table.
+
+    When page_size is a positive number, rows are consumed lazily from the
+    iterable and printed in tables of at most page_size rows, so large
+    result sets are never held in a single Table. Otherwise all rows are
+    printed in one table.
+    """
+    console = Console()
+    title = "ONVIF Camera Scan Results"
+
+    if not page_size or page_size <= 0:
+        page_size = None
+
+    first_row = 1
+    for page in _pages(cameras, page_size):
+        page_title = title
+        if page_size:
+            page_title = f"{title} (rows {first_row}-{first_row + len(page) - 1})"
+        table = _new_table(page_title)
+
+        for cam in page:
+            ptz_support = "Yes" if _ptz_supported(cam) else "No"
+            num_streams = str(len(cam.profiles))
+
+            table.add_row(
+                cam.ip,
+                cam.manufacturer,
+                cam.model,
+                ptz_support,
+                num_streams
+            )
+
+        console.print(table)
+        first_row += len(page)
+
+    if first_row == 1:
+        console.print("[yellow]No cameras to display.[/yellow]")
+
+def summarize_cameras(cameras: Iterable[CameraInfo], subnets: Optional[Iterable[str]] = None) -> Dict[str, Counter]:
+    """
+    Aggregates cameras in a single pass, grouped by subnet, manufacturer
+    and (manufacturer, model).
+    Each camera is grouped under the most specific of the given subnets that
+    contains it, or under a /24 (IPv4) or /64 (IPv6) network otherwise.
+    Returns a dict mapping each grouping name to a Counter of camera counts.
+    """
+    networks = _parse_networks(subnets)
+    summary: Dict[str, Counter] = {
+        "subnet": Counter(),
+        "manufacturer": Counter(),
+        "model": Counter(),
+    }
     for cam in cameras:
-        ptz_support = "Yes" if cam.ptz and cam.ptz.supported else "No"
-        num_streams = str(len(cam.profiles))
+        summary["subnet"][_subnet_of(cam.ip, networks)] += 1
+        summary["manufacturer"][cam.manufacturer] += 1
+        summary["model"][(cam.manufacturer, cam.model)] += 1
+    return summary
 
-        table.add_row(
-            cam.ip,
-            cam.manufacturer,
-            cam.model,
-            ptz_support,
-            num_streams
-        )
+def print_aggregate_summary(cameras: Iterable[CameraInfo], subnets: Optional[Iterable[str]] = None):
+    """
+    Prints camera counts grouped by subnet, manufacturer and model instead of
+    one row per camera. See summarize_cameras for how subnets are used.
+    """
+    console = Console()
+    summary = summarize_cameras(cameras, subnets)
+
+    if not summary["manufacturer"]:
+        console.print("[yellow]No cameras to summarize.[/yellow]")
+        return
+
+    table = Table(title="Cameras by Subnet")
+    table.add_column("Subnet", style="cyan", no_wrap=True)
+    table.add_column("Cameras", justify="right")
+    for subnet, count in sorted(summary["subnet"].items(), key=lambda item: _subnet_sort_key(item[0])):
+        table.add_row(subnet, str(count))
+    console.print(table)
+
+    table = Table(title="Cameras by Manufacturer")
+    table.add_column("Manufacturer", style="magenta")
+    table.add_column("Cameras", justify="right")
+    for manufacturer, count in summary["manufacturer"].most_common():
+        table.add_row(manufacturer, str(count))
+    console.print(table)
 
+    table = Table(title="Cameras by Model")
+    table.add_column("Manufacturer", style="magenta")
+    table.add_column("Model", style="green")
+    table.add_column("Cameras", justify="right")
+    for (manufacturer, model), count in summary["model"].most_common():
+        table.add_row(manufacturer, model, str(count))
     console.print(table)
 
-def export_to_json(cameras: List[CameraInfo], filename: str):
+def _csv_row(cam: CameraInfo) -> Dict[str, str]:
+    return {
+        "ip": cam.ip,
+        "manufacturer": cam.manufacturer,
+        "model": cam.model,
+        "firmware": cam.firmware,
+        "serial": cam.serial,
+        "ptz": "Yes" if _ptz_supported(cam) else "No",
+        "streams": str(len(cam.profiles)),
+        "rtsp_uris": " ".join(p.rtsp_uri for p in cam.profiles),
+        "inspection_status": cam.inspection_status,
+    }
+
+def export_to_json(cameras: Iterable[CameraInfo], filename: str) -> bool:
     try:
         data = [asdict(cam) for cam in cameras]
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2)
         logger.info(f"Results exported to {filename}")
+        return True
     except Exception as e:
         logger.error(f"Failed to export to JSON: {e}")
+        return False
+
+def export_to_csv(cameras: Iterable[CameraInfo], filename: str) -> bool:
+    try:
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for cam in cameras:
+                writer.writerow(_csv_row(cam))
+        logger.info(f"Results exported to {filename}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to export to CSV: {e}")
+        return False
+
+def export_to_ndjson(cameras: Iterable[CameraInfo], filename: str) -> bool:
+    try:
+        with open(filename, 'w') as f:
+            for cam in cameras:
+                f.write(json.dumps(asdict(cam)))
+                f.write("\n")
+        logger.info(f"Results exported to {filename}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to export to NDJSON: {e}")
+        return False
+
+EXPORTERS = {
+    "json": export_to_json,
+    "csv": export_to_csv,
+    "ndjson": export_to_ndjson,
+}
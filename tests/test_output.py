@@ -0,0 +1,156 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from rich.console import Console
+from onvif_scanner.models import CameraInfo, StreamProfile, PTZInfo
+from onvif_scanner.output import (
+    summarize_cameras,
+    print_summary_table,
+    print_aggregate_summary,
+    export_to_csv,
+    export_to_ndjson,
+)
+
+def make_camera(ip, manufacturer="TestMfg", model="TestModel"):
+    return CameraInfo(
+        ip=ip,
+        manufacturer=manufacturer,
+        model=model,
+        firmware="1.0",
+        serial="12345",
+        profiles=[StreamProfile("Main", "token1", f"rtsp://{ip}/stream1")],
+        ptz=PTZInfo(supported=True),
+    )
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.cameras = [
+            make_camera("192.168.1.10"),
+            make_camera("192.168.1.11", model="OtherModel"),
+            make_camera("10.8.0.5", manufacturer="OtherMfg"),
+        ]
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_summarize_cameras(self):
+        summary = summarize_cameras(iter(self.cameras))
+
+        self.assertEqual(summary["subnet"]["192.168.1.0/24"], 2)
+        self.assertEqual(summary["subnet"]["10.8.0.0/24"], 1)
+        self.assertEqual(summary["manufacturer"]["TestMfg"], 2)
+        self.assertEqual(summary["model"][("TestMfg", "OtherModel")], 1)
+
+    def test_summarize_cameras_uses_scanned_subnets(self):
+        cameras = self.cameras + [make_camera("fe80::1"), make_camera("not-an-ip")]
+        summary = summarize_cameras(cameras, subnets=["10.0.0.0/8", "192.168.0.0/16", "192.168.1.8/30"])
+
+        self.assertEqual(summary["subnet"]["192.168.1.8/30"], 2)
+        self.assertEqual(summary["subnet"]["10.0.0.0/8"], 1)
+        self.assertEqual(summary["subnet"]["fe80::/64"], 1)
+        self.assertEqual(summary["subnet"]["unknown"], 1)
+
+    def test_export_to_csv(self):
+        filename = os.path.join(self.tmpdir.name, "out.csv")
+        export_to_csv(iter(self.cameras), filename)
+
+        with open(filename, newline='') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["ip"], "192.168.1.10")
+        self.assertEqual(rows[0]["ptz"], "Yes")
+        self.assertEqual(rows[0]["rtsp_uris"], "rtsp://192.168.1.10/stream1")
+
+    def test_export_to_ndjson(self):
+        filename = os.path.join(self.tmpdir.name, "out.ndjson")
+        export_to_ndjson(iter(self.cameras), filename)
+
+        with open(filename) as f:
+            records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[2]["manufacturer"], "OtherMfg")
+        self.assertEqual(records[0]["profiles"][0]["token"], "token1")
+
+class TestConsoleOutput(unittest.TestCase):
+    def setUp(self):
+        self.console = Console(record=True, width=200)
+        patcher = patch('onvif_scanner.output.Console', return_value=self.console)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tables_printed(self, mock_print):
+        return [call.args[0].title for call in mock_print.call_args_list if hasattr(call.args[0], "title")]
+
+    def test_paged_table_titles(self):
+        cameras = [make_camera(f"192.168.1.{i}") for i in range(1, 8)]
+
+        with patch.object(self.console, 'print', wraps=self.console.print) as mock_print:
+            print_summary_table(cameras, page_size=3)
+
+        self.assertEqual(self.tables_printed(mock_print), [
+            "ONVIF Camera Scan Results (rows 1-3)",
+            "ONVIF Camera Scan Results (rows 4-6)",
+            "ONVIF Camera Scan Results (rows 7-7)",
+        ])
+        text = self.console.export_text()
+        for i in range(1, 8):
+            self.assertIn(f"192.168.1.{i} ", text)
+
+    def test_paged_table_reads_generator_lazily(self):
+        consumed = []
+
+        def camera_stream():
+            for i in range(1, 8):
+                consumed.append(i)
+                yield make_camera(f"192.168.1.{i}")
+
+        consumed_at_print = []
+        stream = camera_stream()
+        with patch.object(self.console, 'print', side_effect=lambda *a, **k: consumed_at_print.append(len(consumed))):
+            print_summary_table(stream, page_size=3)
+
+        self.assertEqual(consumed_at_print, [3, 6, 7])
+        self.assertEqual(list(stream), [])
+
+    def test_non_positive_page_size_prints_single_table(self):
+        cameras = [make_camera(f"192.168.1.{i}") for i in range(1, 8)]
+
+        for page_size in (None, 0, -5):
+            with patch.object(self.console, 'print', wraps=self.console.print) as mock_print:
+                print_summary_table(iter(cameras), page_size=page_size)
+            self.assertEqual(self.tables_printed(mock_print), ["ONVIF Camera Scan Results"])
+
+    def test_empty_input(self):
+        print_summary_table(iter([]), page_size=3)
+        print_summary_table([])
+        print_aggregate_summary(iter([]))
+
+        text = self.console.export_text()
+        self.assertIn("No cameras to display.", text)
+        self.assertIn("No cameras to summarize.", text)
+        self.assertNotIn("ONVIF Camera Scan Results", text)
+
+    def test_aggregate_summary_subnet_order(self):
+        cameras = [
+            make_camera("10.0.0.1"),
+            make_camera("not-an-ip"),
+            make_camera("9.1.1.1"),
+            make_camera("fe80::1"),
+            make_camera("192.168.1.1"),
+        ]
+        print_aggregate_summary(cameras)
+
+        text = self.console.export_text()
+        positions = [text.index(s) for s in ("9.1.1.0/24", "10.0.0.0/24", "192.168.1.0/24", "fe80::/64", "unknown")]
+        self.assertEqual(positions, sorted(positions))
+        self.assertIn("Cameras by Manufacturer", text)
+        self.assertIn("Cameras by Model", text)
+
+if __name__ == '__main__':
+    unittest.main()